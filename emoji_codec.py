@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
+import fnmatch
+import functools
 import math
+import os
+import queue
+import struct
+import threading
 import zlib
 import hashlib
 import mimetypes
-import base64
-from typing import Dict, Union, List, Tuple, BinaryIO
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Iterator, Union, List, Tuple, BinaryIO, TextIO
 from pathlib import Path
-import json
 
 class CompressionMethod:
     NONE = 'none'
@@ -44,47 +50,226 @@ class FileHandler:
         with open(file_path, 'wb') as f:
             f.write(content)
 
+def _iter_pattern(file_pattern: str):
+    """
+    Yield file paths matching a glob-style pattern
+
+    Walks the pattern's directory with os.scandir instead of
+    materializing a glob list, yielding plain path strings as entries
+    are discovered. Patterns with wildcards in the directory part fall
+    back to glob.iglob.
+    """
+    directory, name_pattern = os.path.split(file_pattern)
+    if any(ch in directory for ch in '*?['):
+        from glob import iglob
+        yield from iglob(file_pattern)
+        return
+
+    try:
+        entries = os.scandir(directory or '.')
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            # Match glob semantics: skip dotfiles unless asked for
+            if entry.name.startswith('.') and not name_pattern.startswith('.'):
+                continue
+            if entry.is_file() and fnmatch.fnmatch(entry.name, name_pattern):
+                yield entry.path if directory else entry.name
+
+
+# Masks for the low n bits, indexed by n, so the hot loops below replace
+# a shift and subtract per chunk with one table load
+_TAIL_MASKS = tuple((1 << i) - 1 for i in range(33))
+
+# Chunk widths repeat on a fixed stride (lcm with 8 bits): 3 bytes make
+# four 6-bit chunks, 7 bytes make eight 7-bit chunks, 5 bytes make four
+# 10-bit chunks. Shift offsets for extracting each chunk of a group:
+_STRIDE_SHIFTS = {
+    6: (18, 12, 6, 0),
+    7: (49, 42, 35, 28, 21, 14, 7, 0),
+    10: (30, 20, 10, 0),
+}
+
+
+def _pack_bits_fixed(data: bytes, bits_per_chunk: int,
+                     mask: int) -> List[int]:
+    """
+    Pack a byte buffer using a fixed-stride group extractor
+
+    Whole groups are lifted with one int.from_bytes and split by
+    precomputed shifts, avoiding the per-byte accumulator; the ragged
+    tail falls back to _pack_bits. Group boundaries are both byte- and
+    chunk-aligned, so output matches the generic packer exactly.
+    """
+    shifts = _STRIDE_SHIFTS[bits_per_chunk]
+    group_bytes = (bits_per_chunk * len(shifts)) // 8
+    end = len(data) - (len(data) % group_bytes)
+
+    indices = []
+    append = indices.append
+    from_bytes = int.from_bytes
+
+    for i in range(0, end, group_bytes):
+        value = from_bytes(data[i:i + group_bytes], 'big')
+        for shift in shifts:
+            append((value >> shift) & mask)
+
+    if end < len(data):
+        tail, _ = _pack_bits(data[end:], bits_per_chunk, mask)
+        indices += tail
+
+    return indices
+
+
+def _pack_bits(data: bytes, bits_per_chunk: int, mask: int,
+               state: Tuple[int, int] = (0, 0),
+               final: bool = True) -> Tuple[List[int], Tuple[int, int]]:
+    """
+    Pack a byte buffer into a list of bits_per_chunk-wide indices
+
+    The (current_value, current_bits) accumulator state is passed in and
+    returned so callers can stream data through in chunks; pass
+    final=False for all but the last chunk. Kept as a module-level
+    function over plain ints so it can be JIT/AOT-compiled as a unit if
+    an accelerator is ever available.
+    """
+    current_value, current_bits = state
+    tail_masks = _TAIL_MASKS
+    indices = []
+    append = indices.append
+
+    for byte in data:
+        current_value = (current_value << 8) | byte
+        current_bits += 8
+
+        while current_bits >= bits_per_chunk:
+            current_bits -= bits_per_chunk
+            append((current_value >> current_bits) & mask)
+            current_value &= tail_masks[current_bits]
+
+    # Handle remaining bits
+    if final and current_bits > 0:
+        append((current_value << (bits_per_chunk - current_bits)) & mask)
+        current_value = current_bits = 0
+
+    return indices, (current_value, current_bits)
+
+
+def _unpack_bits(values: Union[bytes, memoryview, List[int]], bits_per_chunk: int,
+                 state: Tuple[int, int] = (0, 0)) -> Tuple[bytes, Tuple[int, int]]:
+    """
+    Unpack bits_per_chunk-wide values back into the original bytes
+
+    Mirrors _pack_bits: the accumulator state is threaded through so
+    emoji input can be decoded chunk by chunk. Trailing bits smaller
+    than a byte are encoder padding and stay in the state unwritten.
+    """
+    current_value, current_bits = state
+
+    # Output size is exact: every full byte of accumulated bits is
+    # emitted, so preallocate and index instead of appending
+    result = bytearray((len(values) * bits_per_chunk + current_bits) // 8)
+    tail_masks = _TAIL_MASKS
+    pos = 0
+
+    for value in values:
+        current_value = (current_value << bits_per_chunk) | value
+        current_bits += bits_per_chunk
+
+        while current_bits >= 8:
+            current_bits -= 8
+            result[pos] = (current_value >> current_bits) & 0xFF
+            pos += 1
+            current_value &= tail_masks[current_bits]
+
+    return bytes(result), (current_value, current_bits)
+
+
 class EmojiCodec:
     def __init__(self, recipe_type: str = "classic",
                  compression: str = CompressionMethod.NONE,
-                 verification: str = VerificationMethod.NONE):
-        """Initialize codec with specified settings"""
+                 verification: str = VerificationMethod.NONE,
+                 compression_level: int = 1):
+        """
+        Initialize codec with specified settings
+
+        compression_level defaults to 1 (fastest): the bit-packing step
+        inflates output by 4x regardless, so the few percent of ratio a
+        high level buys rarely justifies its CPU cost here.
+        """
         self.recipe_type = recipe_type
         self.compression = compression
         self.verification = verification
+        self.compression_level = compression_level
         self._initialize_ingredients()
 
-    def _initialize_ingredients(self):
-        """Initialize encoding maps based on recipe type"""
-        # Recipe configuration: (base_size, unicode_start)
-        recipes = {
-            "quick": (64, 0x1F345),    # Food emojis
-            "light": (128, 0x1F3B0),   # Activity emojis
-            "classic": (256, 0x1F600), # Smiley emojis
-            "gourmet": (1024, 0x1F900) # Extended emojis
-        }
-        
-        base_size, start_code = recipes.get(
-            self.recipe_type, 
-            recipes["classic"]
-        )
-        
+    # Recipe configuration: (base_size, unicode_start)
+    _RECIPES = {
+        "quick": (64, 0x1F345),    # Food emojis
+        "light": (128, 0x1F3B0),   # Activity emojis
+        "classic": (256, 0x1F600), # Smiley emojis
+        "gourmet": (1024, 0x1F900) # Extended emojis
+    }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_maps(recipe_type: str) -> Tuple:
+        """
+        Build the ingredient tables for a recipe
+
+        Tables are fixed per recipe and immutable, so they are built
+        once and shared by every instance (cheap construction in worker
+        pools).
+        """
+        base_size, start_code = EmojiCodec._RECIPES[recipe_type]
+
         # Create encoding/decoding maps
-        self.emoji_map = {
-            i: chr(start_code + i) 
-            for i in range(base_size)
+        # emoji_chars is indexed directly by chunk value (no dict
+        # hashing); reverse_map keys on the codepoint so decode can
+        # look up via ord() or str.translate
+        emoji_chars = ''.join(
+            chr(start_code + i) for i in range(base_size)
+        )
+        reverse_map = {
+            start_code + i: i for i in range(base_size)
         }
-        self.reverse_map = {v: k for k, v in self.emoji_map.items()}
-        
-        # Calculate encoding parameters
-        self.base_size = base_size
-        self.bits_per_chunk = int(math.log2(base_size))
-        self.mask = (1 << self.bits_per_chunk) - 1
+
+        # Every emoji in these ranges is a fixed-width UTF-8 sequence,
+        # so encoding can gather precomputed byte strings and decode
+        # the result once
+        utf8_table = tuple(
+            chr(start_code + i).encode('utf-8') for i in range(base_size)
+        )
+
+        return (
+            emoji_chars,
+            tuple(emoji_chars),
+            reverse_map,
+            base_size,
+            int(math.log2(base_size)),
+            base_size - 1,
+            chr(start_code),
+            chr(start_code + base_size - 1),
+            utf8_table
+        )
+
+    def _initialize_ingredients(self):
+        """Initialize encoding maps based on recipe type"""
+        # Unknown recipes fall back to classic, so normalize the cache key
+        recipe = (self.recipe_type
+                  if self.recipe_type in self._RECIPES else "classic")
+
+        (self.emoji_chars, self.emoji_map, self.reverse_map,
+         self.base_size, self.bits_per_chunk, self.mask,
+         self._first_char, self._last_char, self._utf8_table) = \
+            self._build_maps(recipe)
 
     def _process_data(self, data: bytes, compress: bool = True) -> bytes:
         """Process data with optional compression"""
         if compress and self.compression == CompressionMethod.ZLIB:
-            return zlib.compress(data)
+            return zlib.compress(data, self.compression_level)
         return data
 
     def _unprocess_data(self, data: bytes, decompress: bool = True) -> bytes:
@@ -93,55 +278,68 @@ class EmojiCodec:
             return zlib.decompress(data)
         return data
 
-    def _calculate_hash(self, data: bytes) -> str:
-        """Calculate hash of data if verification enabled"""
-        if self.verification == VerificationMethod.SHA256:
+    def _calculate_hash(self, data: Union[bytes, BinaryIO]) -> str:
+        """
+        Calculate hash of data if verification enabled
+
+        Accepts raw bytes or an open binary file; files are digested
+        straight from the stream (hashlib.file_digest) without pulling
+        the content through an intermediate buffer.
+        """
+        if self.verification != VerificationMethod.SHA256:
+            return ''
+        if isinstance(data, (bytes, bytearray, memoryview)):
             return hashlib.sha256(data).hexdigest()
-        return ''
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(data, 'sha256').hexdigest()
+        hasher = hashlib.sha256()
+        while buf := data.read(262144):
+            hasher.update(buf)
+        return hasher.hexdigest()
 
-    def encode(self, data: str) -> str:
+    def encode(self, data: Union[str, bytes, bytearray, memoryview]) -> str:
         """
-        Encode a string into emoji representation
-        
+        Encode a string or raw bytes into emoji representation
+
         Args:
-            data: String to encode
-            
+            data: String (converted as UTF-8) or bytes-like to encode
+
         Returns:
             Emoji-encoded string
-            
+
         Raises:
             ValueError: If encoding fails
         """
         try:
-            # Convert to bytes and process
-            byte_data = data.encode('utf-8')
-            processed = self._process_data(byte_data)
-            
-            # Encode to emojis
-            result = []
-            current_bits = 0
-            current_value = 0
-            
-            for byte in processed:
-                current_value = (current_value << 8) | byte
-                current_bits += 8
-                
-                while current_bits >= self.bits_per_chunk:
-                    current_bits -= self.bits_per_chunk
-                    index = (current_value >> current_bits) & self.mask
-                    result.append(self.emoji_map[index])
-                    current_value &= (1 << current_bits) - 1
-            
-            # Handle remaining bits
-            if current_bits > 0:
-                index = (current_value << (self.bits_per_chunk - current_bits)) & self.mask
-                result.append(self.emoji_map[index])
-                
-            return ''.join(result)
-            
+            # Bytes-like input skips the UTF-8 conversion entirely
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                byte_data = data
+            else:
+                byte_data = data.encode('utf-8')
+            return self._encode_bytes(byte_data)
+
         except Exception as e:
             raise ValueError(f"Encoding error: {str(e)}")
 
+    def _encode_bytes(self, byte_data: bytes) -> str:
+        """Compress (if enabled) and bit-pack raw bytes into emoji text"""
+        processed = self._process_data(byte_data)
+
+        # Encode to emojis; classic (8 bits per emoji) maps bytes to
+        # table entries directly, the other recipes use their
+        # fixed-stride extractor
+        if self.bits_per_chunk == 8:
+            indices = processed
+        elif self.bits_per_chunk in _STRIDE_SHIFTS:
+            indices = _pack_bits_fixed(processed, self.bits_per_chunk, self.mask)
+        else:
+            indices, _ = _pack_bits(processed, self.bits_per_chunk, self.mask)
+        # Byte-table gather measures as fast as filling a uint32
+        # codepoint buffer and well ahead of joining one-char strings
+        return b''.join(
+            map(self._utf8_table.__getitem__, indices)
+        ).decode('utf-8')
+
     def decode(self, emoji_data: str) -> str:
         """
         Decode emoji representation back to original string
@@ -156,28 +354,165 @@ class EmojiCodec:
             ValueError: If decoding fails
         """
         try:
-            # Decode emojis
-            result = bytearray()
-            current_bits = 0
-            current_value = 0
-            
-            for emoji in emoji_data:
-                value = self.reverse_map[emoji]
-                current_value = (current_value << self.bits_per_chunk) | value
-                current_bits += self.bits_per_chunk
-                
-                while current_bits >= 8:
-                    current_bits -= 8
-                    byte = (current_value >> current_bits) & 0xFF
-                    result.append(byte)
-                    current_value &= (1 << current_bits) - 1
-            
-            # Unprocess data
-            processed = bytes(result)
-            original = self._unprocess_data(processed)
-            
-            return original.decode('utf-8')
-            
+            return self._decode_bytes(emoji_data).decode('utf-8')
+
+        except Exception as e:
+            raise ValueError(f"Decoding error: {str(e)}")
+
+    def decode_to_bytes(self, emoji_data: str) -> bytes:
+        """
+        Decode emoji representation back to raw bytes
+
+        Same as decode() but without the terminal UTF-8 conversion, for
+        payloads that were encoded from bytes rather than text.
+
+        Raises:
+            ValueError: If decoding fails
+        """
+        try:
+            return self._decode_bytes(emoji_data)
+
+        except Exception as e:
+            raise ValueError(f"Decoding error: {str(e)}")
+
+    def _emoji_values(self, emoji_data: str) -> Union[bytes, memoryview]:
+        """
+        Map emoji text to its chunk values in one str.translate pass
+
+        Replaces a per-emoji dict lookup with a single C-level translate;
+        the values come back as a byte string (base <= 256) or a uint16
+        memoryview (gourmet). Raises ValueError on characters outside
+        the recipe's range.
+        """
+        if emoji_data and not (
+            self._first_char <= min(emoji_data)
+            and max(emoji_data) <= self._last_char
+        ):
+            raise ValueError("input contains non-recipe characters")
+
+        translated = emoji_data.translate(self.reverse_map)
+        if self.base_size <= 256:
+            return translated.encode('latin-1')
+        return memoryview(translated.encode('utf-16-le')).cast('H')
+
+    def _decode_bytes(self, emoji_data: str) -> bytes:
+        """Bit-unpack emoji text and decompress back to raw bytes"""
+        values = self._emoji_values(emoji_data)
+
+        # Classic recipe: chunk values are the payload bytes themselves
+        if self.bits_per_chunk == 8:
+            processed = values
+        else:
+            processed, _ = _unpack_bits(values, self.bits_per_chunk)
+
+        # Unprocess data
+        return self._unprocess_data(processed)
+
+    def encode_stream(self, reader: BinaryIO, writer: TextIO,
+                      chunk_size: int = 262144) -> Dict:
+        """
+        Encode a binary stream into emoji text incrementally
+
+        Reads chunk_size bytes at a time and feeds compression, hashing
+        and bit-packing as data arrives, so peak memory is bounded by
+        the chunk size rather than the stream length.
+
+        Returns:
+            Dictionary with original_bytes, encoded_length and hash
+            (empty string when verification is disabled)
+        """
+        try:
+            compressor = (zlib.compressobj(self.compression_level)
+                          if self.compression == CompressionMethod.ZLIB
+                          else None)
+            hasher = (hashlib.sha256()
+                      if self.verification == VerificationMethod.SHA256
+                      else None)
+            bits_per_chunk = self.bits_per_chunk
+            mask = self.mask
+            utf8_table = self._utf8_table
+
+            original_bytes = 0
+            encoded_length = 0
+            state = (0, 0)
+
+            while True:
+                buf = reader.read(chunk_size)
+                final = not buf
+                if buf:
+                    original_bytes += len(buf)
+                    if hasher:
+                        hasher.update(buf)
+                    if compressor:
+                        buf = compressor.compress(buf)
+                elif compressor:
+                    buf = compressor.flush()
+
+                indices, state = _pack_bits(
+                    buf, bits_per_chunk, mask, state, final
+                )
+                if indices:
+                    encoded = b''.join(
+                        map(utf8_table.__getitem__, indices)
+                    ).decode('utf-8')
+                    encoded_length += len(encoded)
+                    writer.write(encoded)
+
+                if final:
+                    break
+
+            return {
+                'original_bytes': original_bytes,
+                'encoded_length': encoded_length,
+                'hash': hasher.hexdigest() if hasher else ''
+            }
+
+        except Exception as e:
+            raise ValueError(f"Encoding error: {str(e)}")
+
+    def decode_stream(self, reader: TextIO, writer: BinaryIO,
+                      chunk_size: int = 65536) -> Dict:
+        """
+        Decode emoji text from a stream back into binary data
+
+        Counterpart to encode_stream: emoji characters are read in
+        chunks and bit-unpacking plus decompression run incrementally.
+
+        Returns:
+            Dictionary with decoded_size
+        """
+        try:
+            decompressor = (zlib.decompressobj()
+                            if self.compression == CompressionMethod.ZLIB
+                            else None)
+            bits_per_chunk = self.bits_per_chunk
+
+            decoded_size = 0
+            state = (0, 0)
+
+            while True:
+                chunk = reader.read(chunk_size)
+                if not chunk:
+                    break
+                values = self._emoji_values(chunk)
+                if bits_per_chunk == 8:
+                    data = values
+                else:
+                    data, state = _unpack_bits(values, bits_per_chunk, state)
+                if decompressor:
+                    data = decompressor.decompress(data)
+                if data:
+                    decoded_size += len(data)
+                    writer.write(data)
+
+            if decompressor:
+                tail = decompressor.flush()
+                if tail:
+                    decoded_size += len(tail)
+                    writer.write(tail)
+
+            return {'decoded_size': decoded_size}
+
         except Exception as e:
             raise ValueError(f"Decoding error: {str(e)}")
 
@@ -210,56 +545,60 @@ class EmojiCodec:
             'bits_per_emoji': bits_per_char
         }
 
-    def _prepare_binary_data(self, data: bytes, mime_type: str = None) -> Dict:
+    # Binary frame layout: mime length (1 byte), data length (4 bytes),
+    # mime type, then the raw payload — no base64 or JSON inflation
+    _FRAME_HEADER = '<BI'
+    _FRAME_HEADER_SIZE = struct.calcsize(_FRAME_HEADER)
+
+    def _prepare_binary_data(self, data: bytes, mime_type: str = None) -> bytes:
         """
         Prepare binary data for encoding
-        
-        Returns dictionary with:
-            - content: Base64 encoded data
-            - mime_type: MIME type if provided
-            - size: Original size in bytes
+
+        Returns a length-prefixed frame: header, UTF-8 mime type, then
+        the payload untouched.
         """
-        return {
-            'content': base64.b64encode(data).decode('utf-8'),
-            'mime_type': mime_type,
-            'size': len(data)
-        }
+        mime_bytes = (mime_type or '').encode('utf-8')
+        header = struct.pack(self._FRAME_HEADER, len(mime_bytes), len(data))
+        return header + mime_bytes + data
 
-    def _restore_binary_data(self, data: Dict) -> bytes:
-        """Restore binary data from prepared format"""
-        return base64.b64decode(data['content'].encode('utf-8'))
+    def _restore_binary_data(self, frame: bytes) -> Tuple[bytes, str]:
+        """Restore (content, mime_type) from a prepared frame"""
+        mime_len, data_len = struct.unpack_from(self._FRAME_HEADER, frame)
+        offset = self._FRAME_HEADER_SIZE
+        # A valid frame accounts for every byte except at most one
+        # trailing bit-padding byte; anything else (old JSON-format
+        # files, corrupt input) must fail instead of yielding garbage
+        if len(frame) - (offset + mime_len + data_len) not in (0, 1):
+            raise ValueError("not a framed emoji encoding")
+        mime_bytes = frame[offset:offset + mime_len]
+        content = frame[offset + mime_len:offset + mime_len + data_len]
+        return content, mime_bytes.decode('utf-8') if mime_len else None
 
     def encode_binary(self, data: bytes, mime_type: str = None) -> str:
         """
         Encode binary data with mime type information
         """
         try:
-            # Prepare binary data
-            prepared = self._prepare_binary_data(data, mime_type)
-            
-            # Convert to JSON and encode
-            json_data = json.dumps(prepared)
-            return self.encode(json_data)
-            
+            # Frame and encode, no UTF-8 round-trip on the payload
+            frame = self._prepare_binary_data(data, mime_type)
+            return self._encode_bytes(frame)
+
         except Exception as e:
             raise ValueError(f"Binary encoding error: {str(e)}")
 
     def decode_binary(self, encoded: str) -> Tuple[bytes, str]:
         """
         Decode binary data and return content with mime type
-        
+
         Returns:
             Tuple of (content, mime_type)
         """
         try:
-            # Decode emoji encoding
-            json_data = self.decode(encoded)
-            data = json.loads(json_data)
-            
-            # Restore binary data
-            content = self._restore_binary_data(data)
-            return content, data.get('mime_type')
-            
+            # Decode emoji encoding and unwrap the frame; the length
+            # prefix also drops any trailing bit-padding byte
+            frame = self._decode_bytes(encoded)
+            return self._restore_binary_data(frame)
+
         except Exception as e:
             raise ValueError(f"Binary decoding error: {str(e)}")
 
@@ -271,19 +610,30 @@ class EmojiCodec:
         """
         try:
             if operation == 'encode':
+                # Large files stream through the threaded pipeline
+                if os.path.getsize(input_path) >= self._PIPELINE_THRESHOLD:
+                    return self._process_file_pipelined(input_path, output_path)
+
+                # Hash straight from disk (no intermediate buffer)
+                file_hash = ''
+                if self.verification == VerificationMethod.SHA256:
+                    with open(input_path, 'rb') as f:
+                        file_hash = self._calculate_hash(f)
+
                 # Read and encode file
                 content, mime_type = FileHandler.read_file(input_path)
                 encoded = self.encode_binary(content, mime_type)
-                
+
                 # Write encoded data
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(encoded)
-                
+
                 return {
                     'original_bytes': len(content),
                     'encoded_length': len(encoded),
                     'mime_type': mime_type,
-                    'actual_ratio': len(encoded)/len(content)
+                    'actual_ratio': len(encoded)/len(content),
+                    'hash': file_hash
                 }
                 
             else:  # decode
@@ -303,44 +653,197 @@ class EmojiCodec:
         except Exception as e:
             raise ValueError(f"File processing error: {str(e)}")
 
+    # Encode files at least this big through the threaded pipeline
+    _PIPELINE_THRESHOLD = 8 * 1024 * 1024
+
+    def _process_file_pipelined(self, input_path: Union[str, Path],
+                                output_path: Union[str, Path]) -> Dict:
+        """
+        Encode one large file through a producer/consumer pipeline
+
+        Reading, compress+hash and pack+write run as separate stages
+        joined by bounded queues; zlib and hashlib release the GIL in
+        their C code, so the stages overlap on real threads. Output is
+        identical to the buffered encode path.
+        """
+        input_path = str(input_path)
+        size = os.path.getsize(input_path)
+        mime_type, _ = mimetypes.guess_type(input_path)
+        mime_type = mime_type or 'application/octet-stream'
+
+        read_queue = queue.Queue(4)
+        pack_queue = queue.Queue(4)
+        failures = []
+        hasher = (hashlib.sha256()
+                  if self.verification == VerificationMethod.SHA256
+                  else None)
+
+        def read_stage():
+            try:
+                with open(input_path, 'rb') as f:
+                    while buf := f.read(262144):
+                        read_queue.put(buf)
+            except Exception as e:
+                failures.append(e)
+            finally:
+                read_queue.put(None)
+
+        def compress_stage():
+            try:
+                compressor = (zlib.compressobj(self.compression_level)
+                              if self.compression == CompressionMethod.ZLIB
+                              else None)
+                # The frame header leads the compressed stream; the
+                # payload length is known from stat up front
+                mime_bytes = mime_type.encode('utf-8')
+                header = struct.pack(
+                    self._FRAME_HEADER, len(mime_bytes), size
+                ) + mime_bytes
+                out = compressor.compress(header) if compressor else header
+                if out:
+                    pack_queue.put(out)
+                while (buf := read_queue.get()) is not None:
+                    if hasher:
+                        hasher.update(buf)
+                    out = compressor.compress(buf) if compressor else buf
+                    if out:
+                        pack_queue.put(out)
+                if compressor:
+                    out = compressor.flush()
+                    if out:
+                        pack_queue.put(out)
+            except Exception as e:
+                failures.append(e)
+                # Keep consuming read_queue so the reader can never
+                # block forever on its bounded put; reader.join() below
+                # depends on this to surface the failure instead of
+                # hanging. The timeout covers the window where the
+                # reader is about to exit without producing more.
+                while reader.is_alive() or not read_queue.empty():
+                    try:
+                        if read_queue.get(timeout=0.1) is None:
+                            break
+                    except queue.Empty:
+                        pass
+            finally:
+                pack_queue.put(None)
+
+        reader = threading.Thread(target=read_stage, daemon=True)
+        compressor_thread = threading.Thread(target=compress_stage, daemon=True)
+        reader.start()
+        compressor_thread.start()
+
+        # Pack and write in this thread
+        bits_per_chunk = self.bits_per_chunk
+        mask = self.mask
+        utf8_table = self._utf8_table
+        encoded_length = 0
+        state = (0, 0)
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            while (buf := pack_queue.get()) is not None:
+                if bits_per_chunk == 8:
+                    indices = buf
+                else:
+                    indices, state = _pack_bits(
+                        buf, bits_per_chunk, mask, state, final=False
+                    )
+                if indices:
+                    encoded = b''.join(
+                        map(utf8_table.__getitem__, indices)
+                    ).decode('utf-8')
+                    encoded_length += len(encoded)
+                    f.write(encoded)
+
+            # Flush any buffered padding bits
+            indices, state = _pack_bits(b'', bits_per_chunk, mask, state)
+            if indices:
+                encoded = b''.join(
+                    map(utf8_table.__getitem__, indices)
+                ).decode('utf-8')
+                encoded_length += len(encoded)
+                f.write(encoded)
+
+        reader.join()
+        compressor_thread.join()
+        if failures:
+            raise failures[0]
+
+        return {
+            'original_bytes': size,
+            'encoded_length': encoded_length,
+            'mime_type': mime_type,
+            'actual_ratio': encoded_length / size if size else 0,
+            'hash': hasher.hexdigest() if hasher else ''
+        }
+
     def batch_process(self, file_pattern: str, output_dir: str,
-                     operation: str = 'encode') -> List[Dict]:
+                     operation: str = 'encode') -> Iterator[Dict]:
         """
         Process multiple files with binary support
+
+        Yields one result dict per file so callers can aggregate counts
+        and failures in a single pass without holding every result in
+        memory; wrap in list() if the full result set is needed.
         """
-        from glob import glob
-        
-        # Create output directory
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Get files and process
-        files = glob(file_pattern)
-        results = []
-        
-        for input_file in files:
-            input_path = Path(input_file)
-            if operation == 'encode':
-                output_path = output_dir / f"{input_path.stem}.emoji"
-            else:
-                # Try to preserve original extension for decoding
-                mime_type, _ = mimetypes.guess_type(str(input_path))
-                extension = mimetypes.guess_extension(mime_type) if mime_type else '.bin'
-                output_path = output_dir / f"decoded_{input_path.stem}{extension}"
-                
+        # Create output directory once
+        output_dir = str(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Discover files with os.scandir and pair each with its output
+        # path, staying on plain strings rather than Path objects.
+        # Cheap failure modes are caught here with sentinel results so
+        # workers never pay for (or pickle) an exception on them.
+        files = []
+        output_paths = []
+        invalid = []
+
+        for input_file in _iter_pattern(file_pattern):
             try:
-                stats = self.process_file(input_file, str(output_path), operation)
-                stats['file'] = input_file
-                stats['success'] = True
-                results.append(stats)
-            except Exception as e:
-                results.append({
+                size = os.path.getsize(input_file)
+            except OSError as e:
+                invalid.append({
                     'file': input_file,
                     'success': False,
                     'error': str(e)
                 })
-        
-        return results
+                continue
+            if size == 0:
+                invalid.append({
+                    'file': input_file,
+                    'success': False,
+                    'error': 'empty file'
+                })
+                continue
+
+            stem = os.path.splitext(os.path.basename(input_file))[0]
+            if operation == 'encode':
+                output_name = f"{stem}.emoji"
+            else:
+                # Try to preserve original extension for decoding
+                mime_type, _ = mimetypes.guess_type(input_file)
+                extension = mimetypes.guess_extension(mime_type) if mime_type else '.bin'
+                output_name = f"decoded_{stem}{extension}"
+            files.append(input_file)
+            output_paths.append(os.path.join(output_dir, output_name))
+
+        # Files are independent, so fan out across cores; workers rebuild
+        # the codec from its settings rather than pickling the instance
+        settings = (self.recipe_type, self.compression, self.verification,
+                    self.compression_level)
+        # Below ~4 files, worker spawn and import costs outweigh the
+        # zlib/sha256/packing work they would parallelize
+        if len(files) < 4:
+            for f, o in zip(files, output_paths):
+                yield _process_file_task(settings, f, o, operation)
+        else:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                yield from executor.map(
+                    _process_file_task,
+                    repeat(settings), files, output_paths, repeat(operation)
+                )
+
+        yield from invalid
 
     def get_file_info(self, file_path: Union[str, Path]) -> Dict:
         """
@@ -370,4 +873,27 @@ class EmojiCodec:
         elif size < 102400:  # < 100KB
             return "classic"
         else:
-            return "gourmet"
\ No newline at end of file
+            return "gourmet"
+
+
+def _process_file_task(settings: Tuple, input_file: str,
+                       output_path: str, operation: str) -> Dict:
+    """
+    Process one file for batch_process
+
+    Module-level so pool workers can import it; the codec is rebuilt
+    from its settings tuple instead of pickling the instance. Always
+    returns a result dict rather than raising.
+    """
+    codec = EmojiCodec(*settings)
+    try:
+        stats = codec.process_file(input_file, output_path, operation)
+        stats['file'] = input_file
+        stats['success'] = True
+        return stats
+    except Exception as e:
+        return {
+            'file': input_file,
+            'success': False,
+            'error': str(e)
+        }
\ No newline at end of file
@@ -1,32 +1,82 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import sys
 import argparse
-from pathlib import Path
-from typing import Optional
-from emoji_codec import EmojiCodec, CompressionMethod, VerificationMethod
+
+# EmojiCodec is imported lazily in run(); building the codec tables is
+# wasted work for --help, --version and argparse errors
 
 __version__ = "2.2.0"
 
+COMMANDS = ('encode', 'decode', 'batch', 'interactive', 'analyze')
+
+
+def _sniff_subcommand(argv) -> str | None:
+    """Return the first recognized command token in argv, if any"""
+    for token in argv[1:]:
+        if token in COMMANDS:
+            return token
+    return None
+
+# Resolve color support once at import: piped/redirected output (or an
+# explicit --no-color) gets empty codes, so no escapes are ever written
+# and no per-print stripping is needed
+_USE_COLOR = sys.stdout.isatty() and '--no-color' not in sys.argv
+
 class Colors:
-    """ANSI color codes"""
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+    """ANSI color codes (empty strings when color is disabled)"""
+    if _USE_COLOR:
+        HEADER = '\033[95m'
+        BLUE = '\033[94m'
+        CYAN = '\033[96m'
+        GREEN = '\033[92m'
+        YELLOW = '\033[93m'
+        RED = '\033[91m'
+        ENDC = '\033[0m'
+        BOLD = '\033[1m'
+    else:
+        HEADER = BLUE = CYAN = GREEN = YELLOW = RED = ENDC = BOLD = ''
 
 class EmojiChefCLI:
     def __init__(self):
-        self.parser = self._create_parser()
+        # Only invocations that can actually render help (explicit
+        # -h/--help, or no recognizable command, which ends in a usage
+        # message) pay for the full parser with groups and help prose
+        argv = sys.argv
+        full = ('-h' in argv or '--help' in argv
+                or _sniff_subcommand(argv) is None)
+        self.parser = self._create_parser(full)
         self.use_color = True
+        self._set_prefixes()
+
+    def _set_prefixes(self) -> None:
+        """
+        Precompute color-wrapped message prefixes
+
+        colorize() branches on use_color and builds an f-string on every
+        call; the hot paths (per-message output, batch error listings)
+        use these constants instead.
+        """
+        if self.use_color:
+            self.err_prefix = f"{Colors.RED}Error: {Colors.ENDC}"
+            self.enc_prefix = f"{Colors.GREEN}Encoded: {Colors.ENDC}"
+            self.dec_prefix = f"{Colors.GREEN}Decoded: {Colors.ENDC}"
+        else:
+            self.err_prefix = "Error: "
+            self.enc_prefix = "Encoded: "
+            self.dec_prefix = "Decoded: "
 
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create argument parser with all options"""
-        parser = argparse.ArgumentParser(
-            description="""
+    def _create_parser(self, full: bool = True) -> argparse.ArgumentParser:
+        """
+        Create argument parser with all options
+
+        With full=False the same arguments and defaults are registered
+        on a lean parser without argument groups or help text.
+        """
+        if full:
+            parser = argparse.ArgumentParser(
+                description="""
 EmojiChef v2.2 - Cook up some delicious emoji encodings! 👨‍🍳
 
 A versatile tool for encoding data using emoji characters with support for:
@@ -36,46 +86,55 @@ A versatile tool for encoding data using emoji characters with support for:
 - Data verification
 - Interactive menu interface
 """,
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
+                formatter_class=argparse.RawDescriptionHelpFormatter,
+                epilog="""
 Examples:
   # Basic text encoding
   emojichef-cli.py encode "Hello World"
-  
+
   # Encode with gourmet recipe (base-1024)
   emojichef-cli.py encode -r gourmet "Hello World"
-  
+
   # Encode file with compression and verification
   emojichef-cli.py encode -f input.txt -o output.emoji -c zlib -v sha256
-  
+
   # Decode emoji file
   emojichef-cli.py decode -f encoded.emoji -o decoded.txt
-  
+
   # Batch process text files
   emojichef-cli.py batch "*.txt" --batch-output encoded_files/
-  
+
   # File analysis
   emojichef-cli.py analyze -f document.txt
-  
+
   # Interactive mode
   emojichef-cli.py interactive
 
 For more details and documentation:
 https://github.com/FreddyRodgers/emojichef
 """
-        )
+            )
+
+            # Command groups
+            commands = parser.add_argument_group('Commands')
+            recipe_opts = parser.add_argument_group('Recipe Options')
+            file_opts = parser.add_argument_group('File Options')
+            process_opts = parser.add_argument_group('Processing Options')
 
-        # Command groups
-        commands = parser.add_argument_group('Commands')
-        recipe_opts = parser.add_argument_group('Recipe Options')
-        file_opts = parser.add_argument_group('File Options')
-        process_opts = parser.add_argument_group('Processing Options')
+            def help_text(text):
+                return text
+        else:
+            parser = argparse.ArgumentParser(add_help=False)
+            commands = recipe_opts = file_opts = process_opts = parser
+
+            def help_text(text):
+                return None
 
         # Commands
         commands.add_argument(
             'command',
-            choices=['encode', 'decode', 'batch', 'interactive', 'analyze'],
-            help="""
+            choices=COMMANDS,
+            help=help_text("""
 Operation to perform:
 
   encode      - Convert text/files to emoji encoding
@@ -83,13 +142,13 @@ Operation to perform:
   batch       - Process multiple files
   interactive - Start interactive menu interface
   analyze     - Analyze input and suggest optimal settings
-"""
+""")
         )
 
         commands.add_argument(
             'input',
             nargs='?',
-            help="Input text or file pattern for batch operations"
+            help=help_text("Input text or file pattern for batch operations")
         )
 
         # Recipe options
@@ -97,62 +156,62 @@ Operation to perform:
             '-r', '--recipe',
             choices=['quick', 'light', 'classic', 'gourmet'],
             default='classic',
-            help="""
+            help=help_text("""
 Encoding recipe to use:
   quick   - Base-64 (food emojis)      [compact]
   light   - Base-128 (activity emojis) [balanced]
   classic - Base-256 (smiley emojis)   [standard]
   gourmet - Base-1024 (extended set)   [efficient]
-"""
+""")
         )
 
         recipe_opts.add_argument(
             '-c', '--compression',
             choices=['none', 'zlib'],
             default='none',
-            help="Enable data compression"
+            help=help_text("Enable data compression")
         )
 
         recipe_opts.add_argument(
             '-v', '--verification',
             choices=['none', 'sha256'],
             default='none',
-            help="Enable integrity verification"
+            help=help_text("Enable integrity verification")
         )
 
         # File options
         file_opts.add_argument(
             '-f', '--file',
-            help="Input file path"
+            help=help_text("Input file path")
         )
 
         file_opts.add_argument(
             '-o', '--output',
-            help="Output file path (default: auto-generated)"
+            help=help_text("Output file path (default: auto-generated)")
         )
 
         file_opts.add_argument(
             '--batch-output',
-            help="Output directory for batch processing"
+            help=help_text("Output directory for batch processing")
         )
 
         # Processing options
         process_opts.add_argument(
             '-q', '--quiet',
             action='store_true',
-            help="Suppress progress output"
+            help=help_text("Suppress progress output")
         )
 
         process_opts.add_argument(
             '--no-color',
             action='store_true',
-            help="Disable colored output"
+            help=help_text("Disable colored output")
         )
 
         process_opts.add_argument(
             '--debug',
             action='store_true',
-            help="Enable debug output"
+            help=help_text("Enable debug output")
         )
 
         # Version
@@ -176,15 +235,15 @@ Encoding recipe to use:
             if operation == 'encode':
                 result = codec.encode(text)
                 if not quiet:
-                    print(self.colorize("Encoded: ", Colors.GREEN) + result)
+                    print(self.enc_prefix + result)
             else:
                 result = codec.decode(text)
                 if not quiet:
-                    print(self.colorize("Decoded: ", Colors.GREEN) + result)
+                    print(self.dec_prefix + result)
             return result
-            
+
         except Exception as e:
-            print(self.colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+            print(f"{self.err_prefix}{e}", file=sys.stderr)
             sys.exit(1)
 
     def process_file(self, input_path: str, output_path: str, 
@@ -207,27 +266,34 @@ Encoding recipe to use:
                     print(f"\nDecoded size: {stats['decoded_size']} bytes")
                     
         except Exception as e:
-            print(self.colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+            print(f"{self.err_prefix}{e}", file=sys.stderr)
             sys.exit(1)
 
     def batch_process(self, pattern: str, output_dir: str,
                      codec: EmojiCodec, operation: str, quiet: bool = False) -> None:
         """Process multiple files"""
         try:
-            results = codec.batch_process(pattern, output_dir, operation)
-            
+            # Single pass over the result stream: count as we go and
+            # keep only the failures instead of the full result list
+            total = successful = 0
+            failures = []
+            for result in codec.batch_process(pattern, output_dir, operation):
+                total += 1
+                if result['success']:
+                    successful += 1
+                else:
+                    failures.append(f"- {result['file']}: {result['error']}")
+
             if not quiet:
-                successful = len([r for r in results if r['success']])
-                print(self.colorize(f"\nProcessed {successful}/{len(results)} files", Colors.GREEN))
-                
-                if successful < len(results):
+                print(self.colorize(f"\nProcessed {successful}/{total} files", Colors.GREEN))
+
+                if failures:
+                    # One buffered write instead of a print() per failure
                     print(self.colorize("\nFailed files:", Colors.RED))
-                    for result in results:
-                        if not result['success']:
-                            print(f"- {result['file']}: {result['error']}")
-                            
+                    sys.stdout.write('\n'.join(failures) + '\n')
+
         except Exception as e:
-            print(self.colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+            print(f"{self.err_prefix}{e}", file=sys.stderr)
             sys.exit(1)
 
     def analyze_input(self, input_path: str, codec: EmojiCodec) -> None:
@@ -246,7 +312,7 @@ Encoding recipe to use:
                   ("Recommended" if info['size'] > 1024 else "Optional"))
             
         except Exception as e:
-            print(self.colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+            print(f"{self.err_prefix}{e}", file=sys.stderr)
             sys.exit(1)
 
     def run(self) -> None:
@@ -255,12 +321,24 @@ Encoding recipe to use:
         
         # Handle color setting
         self.use_color = not args.no_color
+        self._set_prefixes()
+        if not self.use_color:
+            # Rebind colorize to an identity lambda so the remaining
+            # call sites skip the per-call use_color branch
+            self.colorize = lambda text, color: text
         
-        # Create codec with specified options
+        # Create codec with specified options (deferred import keeps
+        # --help/--version/usage-error paths free of codec setup)
+        from emoji_codec import EmojiCodec
+        # CompressionMethod/VerificationMethod values are the same
+        # lowercase strings argparse already constrained the choices
+        # to, so the parsed values pass straight through. The old
+        # .upper() calls produced strings that matched no method, which
+        # silently disabled -c/-v
         codec = EmojiCodec(
             recipe_type=args.recipe,
-            compression=args.compression.upper(),
-            verification=args.verification.upper()
+            compression=args.compression,
+            verification=args.verification
         )
         
         # Handle commands
@@ -271,24 +349,26 @@ Encoding recipe to use:
             elif args.input:
                 self.process_text(args.input, codec, 'encode', args.quiet)
             else:
-                print(self.colorize("Error: No input provided", Colors.RED), 
+                print(self.err_prefix + "No input provided",
                       file=sys.stderr)
                 sys.exit(1)
                 
         elif args.command == 'decode':
             if args.file:
+                # pathlib is only needed for the default decode name
+                from pathlib import Path
                 output = args.output or f"decoded_{Path(args.file).stem}"
                 self.process_file(args.file, output, codec, 'decode', args.quiet)
             elif args.input:
                 self.process_text(args.input, codec, 'decode', args.quiet)
             else:
-                print(self.colorize("Error: No input provided", Colors.RED), 
+                print(self.err_prefix + "No input provided",
                       file=sys.stderr)
                 sys.exit(1)
                 
         elif args.command == 'batch':
             if not args.input:
-                print(self.colorize("Error: No input pattern provided", Colors.RED), 
+                print(self.err_prefix + "No input pattern provided",
                       file=sys.stderr)
                 sys.exit(1)
                 
@@ -303,7 +383,7 @@ Encoding recipe to use:
             
         elif args.command == 'analyze':
             if not args.file:
-                print(self.colorize("Error: No input file provided", Colors.RED), 
+                print(self.err_prefix + "No input file provided",
                       file=sys.stderr)
                 sys.exit(1)
             self.analyze_input(args.file, codec)
@@ -316,6 +396,26 @@ Encoding recipe to use:
 def main():
     """Main entry point"""
     try:
+        # Fast path: a bare `encode TEXT` / `decode TEXT` with default
+        # settings needs none of argparse; anything with flags or other
+        # commands falls through to the full CLI
+        argv = sys.argv
+        if (len(argv) == 3 and argv[1] in ('encode', 'decode')
+                and argv[2] and not argv[2].startswith('-')):
+            from emoji_codec import EmojiCodec
+            codec = EmojiCodec()
+            try:
+                if argv[1] == 'encode':
+                    print(f"{Colors.GREEN}Encoded: {Colors.ENDC}"
+                          + codec.encode(argv[2]))
+                else:
+                    print(f"{Colors.GREEN}Decoded: {Colors.ENDC}"
+                          + codec.decode(argv[2]))
+            except Exception as e:
+                print(f"{Colors.RED}Error: {Colors.ENDC}{e}", file=sys.stderr)
+                sys.exit(1)
+            return
+
         cli = EmojiChefCLI()
         cli.run()
     except KeyboardInterrupt:
@@ -1,54 +1,92 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
+import os
 import sys
-from pathlib import Path
-from typing import List
-from emoji_codec import EmojiCodec, CompressionMethod, VerificationMethod
+
+# emoji_codec is imported lazily inside main()/handle_settings(), so menu
+# startup does not pay for codec table construction
+
+# Resolve color support once at import: piped/redirected output (or an
+# explicit --no-color) gets empty codes, so no escapes are ever written
+# and no per-print stripping is needed
+_USE_COLOR = sys.stdout.isatty() and '--no-color' not in sys.argv
 
 class Colors:
-    """ANSI color codes"""
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+    """ANSI color codes (empty strings when color is disabled)"""
+    if _USE_COLOR:
+        HEADER = '\033[95m'
+        BLUE = '\033[94m'
+        CYAN = '\033[96m'
+        GREEN = '\033[92m'
+        YELLOW = '\033[93m'
+        RED = '\033[91m'
+        ENDC = '\033[0m'
+        BOLD = '\033[1m'
+    else:
+        HEADER = BLUE = CYAN = GREEN = YELLOW = RED = ENDC = BOLD = ''
 
-def print_banner():
-    """Display the EmojiChef banner"""
-    banner = f"""
+# The banner and menu are constant text with a couple of color
+# substitutions; build them once at import instead of reformatting on
+# every main-loop iteration
+_BANNER = f"""
 {Colors.CYAN}{Colors.BOLD}
 ███████╗███╗   ███╗ ██████╗      ██╗██╗ ██████╗██╗  ██╗███████╗███████╗
 ██╔════╝████╗ ████║██╔═══██╗     ██║██║██╔════╝██║  ██║██╔════╝██╔════╝
-█████╗  ██╔████╔██║██║   ██║     ██║██║██║     ███████║█████╗  █████╗  
-██╔══╝  ██║╚██╔╝██║██║   ██║██   ██║██║██║     ██╔══██║██╔══╝  ██╔══╝  
-███████╗██║ ╚═╝ ██║╚██████╔╝╚█████╔╝██║╚██████╗██║  ██║███████╗██║     
-╚══════╝╚═╝     ╚═╝ ╚═════╝  ╚════╝ ╚═╝ ╚═════╝╚═╝  ╚═╝╚══════╝╚═╝     
+█████╗  ██╔████╔██║██║   ██║     ██║██║██║     ███████║█████╗  █████╗
+██╔══╝  ██║╚██╔╝██║██║   ██║██   ██║██║██║     ██╔══██║██╔══╝  ██╔══╝
+███████╗██║ ╚═╝ ██║╚██████╔╝╚█████╔╝██║╚██████╗██║  ██║███████╗██║
+╚══════╝╚═╝     ╚═╝ ╚═════╝  ╚════╝ ╚═╝ ╚═════╝╚═╝  ╚═╝╚══════╝╚═╝
 {Colors.BLUE}═════════════════════════════════════════════════════════════════
         Cooking Up Delicious Emoji Encodings! 👨‍🍳 v2.2
 ═════════════════════════════════════════════════════════════════{Colors.ENDC}
+
 """
-    print(banner)
+
+_MENU = f"""
+{Colors.GREEN}=== EmojiChef's Kitchen ==={Colors.ENDC}
+1. Quick Encode/Decode
+2. File Operations
+3. Batch Processing
+4. Recipe Settings
+5. View Recipe Book
+6. Exit Kitchen
+{Colors.GREEN}========================={Colors.ENDC}
+"""
+
+def print_banner():
+    """Display the EmojiChef banner"""
+    sys.stdout.write(_BANNER)
 
 def print_menu():
     """Display the main menu"""
-    print(f"\n{Colors.GREEN}=== EmojiChef's Kitchen ==={Colors.ENDC}")
-    print("1. Quick Encode/Decode")
-    print("2. File Operations")
-    print("3. Batch Processing")
-    print("4. Recipe Settings")
-    print("5. View Recipe Book")
-    print("6. Exit Kitchen")
-    print(f"{Colors.GREEN}========================={Colors.ENDC}")
+    sys.stdout.write(_MENU)
 
-def get_valid_input(prompt: str, valid_options: List[str]) -> str:
+# Prompt strings are constant; render the color wrapping once at import
+_PROMPT_MESSAGE = f"\n{Colors.CYAN}Enter message to encode: {Colors.ENDC}"
+_PROMPT_EMOJI = f"\n{Colors.CYAN}Enter emoji message to decode: {Colors.ENDC}"
+_PROMPT_INPUT_FILE = f"{Colors.CYAN}Enter input file path (or 'cancel'): {Colors.ENDC}"
+_PROMPT_ENCODED_FILE = f"{Colors.CYAN}Enter encoded file path (or 'cancel'): {Colors.ENDC}"
+_PROMPT_ENCODE_OUT = f"{Colors.CYAN}Enter output filename (default: <input>_encoded.emoji): {Colors.ENDC}"
+_PROMPT_DECODE_OUT = f"{Colors.CYAN}Enter output filename (default: <input>_decoded<ext>): {Colors.ENDC}"
+_PROMPT_PATTERN = f"{Colors.CYAN}Enter file pattern (e.g., *.txt): {Colors.ENDC}"
+_PROMPT_OUTPUT_DIR = f"{Colors.CYAN}Enter output directory: {Colors.ENDC}"
+_PROMPT_CONTINUE = f"\n{Colors.CYAN}Press Enter to continue...{Colors.ENDC}"
+
+def get_valid_input(prompt: str, valid_options: list[str]) -> str:
     """Get validated user input"""
+    opts = frozenset(valid_options)
+    colored_prompt = f"{Colors.CYAN}{prompt}{Colors.ENDC}"
+    error_msg = None
     while True:
-        choice = input(f"{Colors.CYAN}{prompt}{Colors.ENDC}").strip()
-        if choice in valid_options:
+        choice = input(colored_prompt)
+        # Menu choices are single characters; skip .strip() for them
+        if choice in opts or (choice := choice.strip()) in opts:
             return choice
-        print(f"{Colors.RED}Invalid choice. Please choose from {', '.join(valid_options)}{Colors.ENDC}")
+        if error_msg is None:
+            error_msg = (f"{Colors.RED}Invalid choice. Please choose from "
+                         f"{', '.join(valid_options)}{Colors.ENDC}")
+        print(error_msg)
 
 def handle_quick_operation(codec: EmojiCodec):
     """Handle quick encode/decode operations"""
@@ -64,7 +102,7 @@ def handle_quick_operation(codec: EmojiCodec):
         
     try:
         if choice == '1':
-            message = input(f"\n{Colors.CYAN}Enter message to encode: {Colors.ENDC}")
+            message = input(_PROMPT_MESSAGE)
             encoded = codec.encode(message)
             stats = codec.get_stats(message, encoded)
             
@@ -74,7 +112,7 @@ def handle_quick_operation(codec: EmojiCodec):
             print(f"Encoded length: {stats['encoded_length']} emojis")
             print(f"Compression ratio: {stats['actual_ratio']:.2f}{Colors.ENDC}")
         else:
-            message = input(f"\n{Colors.CYAN}Enter emoji message to decode: {Colors.ENDC}")
+            message = input(_PROMPT_EMOJI)
             decoded = codec.decode(message)
             print(f"\n{Colors.GREEN}Decoded message: {Colors.ENDC}{decoded}")
             
@@ -83,6 +121,9 @@ def handle_quick_operation(codec: EmojiCodec):
 
 def handle_file_operations(codec: EmojiCodec):
     """Handle file encoding/decoding operations"""
+    # pathlib is only used here; keep it off menu startup
+    from pathlib import Path
+
     print(f"\n{Colors.YELLOW}File Operations{Colors.ENDC}")
     print("1. Encode File")
     print("2. Decode File")
@@ -97,19 +138,23 @@ def handle_file_operations(codec: EmojiCodec):
         if choice == '1':
             # Get input file
             while True:
-                input_file = input(f"{Colors.CYAN}Enter input file path (or 'cancel'): {Colors.ENDC}")
+                input_file = input(_PROMPT_INPUT_FILE)
                 if input_file.lower() == 'cancel':
                     return
                     
-                input_path = Path(input_file).resolve()
-                if input_path.exists():
+                # Cheap existence check per attempt; the syscall-heavy
+                # resolve() walk runs once, after a valid path is given
+                if os.path.exists(input_file):
+                    input_path = Path(input_file).resolve()
                     break
                 print(f"{Colors.RED}File not found. Please enter a valid path.{Colors.ENDC}")
             
             # Get output file
-            output_file = input(f"{Colors.CYAN}Enter output filename (default: <input>_encoded.emoji): {Colors.ENDC}")
+            output_file = input(_PROMPT_ENCODE_OUT)
             if not output_file:
-                output_path = input_path.parent / f"{input_path.stem}_encoded.emoji"
+                # String surgery instead of Path.parent/.stem chains;
+                # splitext is safe with dots in directory names
+                output_path = f"{os.path.splitext(input_file)[0]}_encoded.emoji"
             else:
                 output_path = Path(output_file).resolve()
                 output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -128,18 +173,20 @@ def handle_file_operations(codec: EmojiCodec):
         
         else:  # decode
             while True:
-                input_file = input(f"{Colors.CYAN}Enter encoded file path (or 'cancel'): {Colors.ENDC}")
+                input_file = input(_PROMPT_ENCODED_FILE)
                 if input_file.lower() == 'cancel':
                     return
                     
-                input_path = Path(input_file).resolve()
-                if input_path.exists():
+                # Cheap existence check per attempt; the syscall-heavy
+                # resolve() walk runs once, after a valid path is given
+                if os.path.exists(input_file):
+                    input_path = Path(input_file).resolve()
                     break
                 print(f"{Colors.RED}File not found. Please enter a valid path.{Colors.ENDC}")
             
-            output_file = input(f"{Colors.CYAN}Enter output filename (default: <input>_decoded<ext>): {Colors.ENDC}")
+            output_file = input(_PROMPT_DECODE_OUT)
             if not output_file:
-                output_path = input_path.parent / f"{input_path.stem}_decoded.txt"
+                output_path = f"{os.path.splitext(input_file)[0]}_decoded.txt"
             else:
                 output_path = Path(output_file).resolve()
                 output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -169,24 +216,29 @@ def handle_batch_processing(codec: EmojiCodec):
         return
         
     try:
-        pattern = input(f"{Colors.CYAN}Enter file pattern (e.g., *.txt): {Colors.ENDC}")
-        output_dir = input(f"{Colors.CYAN}Enter output directory: {Colors.ENDC}")
+        pattern = input(_PROMPT_PATTERN)
+        output_dir = input(_PROMPT_OUTPUT_DIR)
         
         print(f"\n{Colors.YELLOW}Processing files...{Colors.ENDC}")
-        results = codec.batch_process(
+        total = successful = 0
+        failures = []
+        for result in codec.batch_process(
             pattern, output_dir,
             'encode' if choice == '1' else 'decode'
-        )
-        
-        successful = len([r for r in results if r['success']])
+        ):
+            total += 1
+            if result['success']:
+                successful += 1
+            else:
+                failures.append(f"{result['file']}: {result['error']}")
+
         print(f"\n{Colors.GREEN}Batch processing complete!")
-        print(f"Successfully processed: {successful}/{len(results)} files{Colors.ENDC}")
-        
-        if successful < len(results):
+        print(f"Successfully processed: {successful}/{total} files{Colors.ENDC}")
+
+        if failures:
             print(f"\n{Colors.RED}Failed files:")
-            for result in results:
-                if not result['success']:
-                    print(f"{result['file']}: {result['error']}")
+            for line in failures:
+                print(line)
             print(Colors.ENDC)
             
     except Exception as e:
@@ -194,6 +246,8 @@ def handle_batch_processing(codec: EmojiCodec):
 
 def handle_settings(codec: EmojiCodec) -> EmojiCodec:
     """Handle codec settings"""
+    from emoji_codec import EmojiCodec, CompressionMethod, VerificationMethod
+
     print(f"\n{Colors.YELLOW}Current Recipe Settings:{Colors.ENDC}")
     print(f"Recipe type: {codec.recipe_type}")
     print(f"Compression: {codec.compression}")
@@ -249,67 +303,54 @@ def handle_settings(codec: EmojiCodec) -> EmojiCodec:
     print(f"\n{Colors.GREEN}Settings updated!{Colors.ENDC}")
     return codec
 
+# Recipe book entries as (name, emojis, best_for, features) tuples —
+# flat immutable data rather than per-call dict allocations
+_RECIPES = (
+    ('Quick Recipe (Base-64)', '🍅🍆🍇',
+     'Small messages, maximum compatibility',
+     ('Food emojis', '6 bits per emoji', 'Fast processing')),
+    ('Light Recipe (Base-128)', '🎰🎱🎲',
+     'Medium-sized messages',
+     ('Activity emojis', '7 bits per emoji', 'Good compatibility')),
+    ('Classic Recipe (Base-256)', '😀😃😄',
+     'General purpose encoding',
+     ('Smiley emojis', '8 bits per emoji', 'Excellent compatibility')),
+    ('Gourmet Recipe (Base-1024)', '🤠🤡🤢',
+     'Large files, maximum efficiency',
+     ('Extended emoji set', '10 bits per emoji', 'Best compression')),
+)
+
+def _build_recipe_book() -> str:
+    """Render the recipe book page (static data, built once at import)"""
+    GREEN = Colors.GREEN
+    ENDC = Colors.ENDC
+    divider = "-" * 40
+    out = [f"\n{Colors.YELLOW}=== EmojiChef's Recipe Book ==={ENDC}\n"]
+    for name, emojis, best_for, features in _RECIPES:
+        out.append(f"\n{GREEN}{name}{ENDC}\n")
+        out.append(f"Sample: {emojis}\n")
+        out.append(f"Best for: {best_for}\n")
+        out.append("Features:\n")
+        for feature in features:
+            out.append(f"  • {feature}\n")
+        out.append(divider + "\n")
+    return ''.join(out)
+
+_RECIPE_BOOK = _build_recipe_book()
+
 def view_recipe_book():
     """Display information about available recipes"""
-    print(f"\n{Colors.YELLOW}=== EmojiChef's Recipe Book ==={Colors.ENDC}")
-    
-    recipes = [
-        {
-            'name': 'Quick Recipe (Base-64)',
-            'emojis': '🍅🍆🍇',
-            'best_for': 'Small messages, maximum compatibility',
-            'features': [
-                'Food emojis',
-                '6 bits per emoji',
-                'Fast processing'
-            ]
-        },
-        {
-            'name': 'Light Recipe (Base-128)',
-            'emojis': '🎰🎱🎲',
-            'best_for': 'Medium-sized messages',
-            'features': [
-                'Activity emojis',
-                '7 bits per emoji',
-                'Good compatibility'
-            ]
-        },
-        {
-            'name': 'Classic Recipe (Base-256)',
-            'emojis': '😀😃😄',
-            'best_for': 'General purpose encoding',
-            'features': [
-                'Smiley emojis',
-                '8 bits per emoji',
-                'Excellent compatibility'
-            ]
-        },
-        {
-            'name': 'Gourmet Recipe (Base-1024)',
-            'emojis': '🤠🤡🤢',
-            'best_for': 'Large files, maximum efficiency',
-            'features': [
-                'Extended emoji set',
-                '10 bits per emoji',
-                'Best compression'
-            ]
-        }
-    ]
-    
-    for recipe in recipes:
-        print(f"\n{Colors.GREEN}{recipe['name']}{Colors.ENDC}")
-        print(f"Sample: {recipe['emojis']}")
-        print(f"Best for: {recipe['best_for']}")
-        print("Features:")
-        for feature in recipe['features']:
-            print(f"  • {feature}")
-        print("-" * 40)
-    
-    input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.ENDC}")
+    sys.stdout.write(_RECIPE_BOOK)
+    input(_PROMPT_CONTINUE)
 
 def main():
     """Main program loop"""
-    print_banner()
+    from emoji_codec import EmojiCodec
+
+    # The banner is decoration; skip its ~1KB of ASCII art when output
+    # is piped or redirected
+    if sys.stdout.isatty():
+        print_banner()
     codec = EmojiCodec()
     
     while True:
@@ -328,7 +369,10 @@ def main():
             view_recipe_book()
         else:
             print(f"\n{Colors.GREEN}Thanks for visiting EmojiChef's Kitchen! 👨‍🍳{Colors.ENDC}")
-            sys.exit(0)
+            # Nothing is left to clean up on the happy path, so skip
+            # atexit/readline teardown; error paths keep sys.exit
+            sys.stdout.flush()
+            os._exit(0)
 
 if __name__ == "__main__":
     try: